@@ -1,15 +1,274 @@
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Literal
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import sha1
+from itertools import cycle
+from threading import Lock
+from time import monotonic
+from typing import Callable, List, Optional, Literal, Tuple
+from google.analytics.data_v1beta import BetaAnalyticsDataClient, BetaAnalyticsDataAsyncClient
+from google.analytics.data_v1beta.services.beta_analytics_data.transports import BetaAnalyticsDataGrpcTransport
 from google.analytics.data_v1beta.types import (DateRange, Dimension, Metric, FilterExpression,
-                                                Filter, RunReportRequest, NumericValue)
+                                                Filter, RunReportRequest, RunReportResponse,
+                                                BatchRunReportsRequest, NumericValue, MetricType)
+
+# max number of rows GA4 returns for a single RunReportRequest, the largest page_size allowed
+PAGE_SIZE = 250000
+# max number of reports GA4 accepts in a single BatchRunReportsRequest
+BATCH_SIZE = 5
+# seconds before a single GA4 request times out
+REQUEST_TIMEOUT = 3600 * 2
+# dtype of each GA4 metric type, metric types not listed are parsed as float64
+METRIC_DTYPES = {MetricType.TYPE_INTEGER: np.int64}
+# seconds a run_report result is served from the report cache
+REPORT_CACHE_TTL = 300
+# max number of reports kept in the report cache, the oldest report is dropped first. 0 turns the cache off
+REPORT_CACHE_MAX_ENTRIES = 32
+
+_report_cache = {}
+_report_cache_stats = {'hits': 0, 'misses': 0}
+_report_cache_lock = Lock()
+# async clients per (creds_path, event loop), see _get_async_client
+_async_clients = {}
+_async_clients_lock = Lock()
+
+
+def report_cache_info() -> dict:
+    """
+    Hit and miss counters of the run_report cache
+
+    :return: dict with hits, misses and the number of cached reports
+    """
+    with _report_cache_lock:
+        _prune_report_cache(monotonic())
+        return {**_report_cache_stats, 'size': len(_report_cache)}
+
+
+def clear_report_cache() -> None:
+    """
+    Remove every cached report and reset the hit and miss counters
+    """
+    with _report_cache_lock:
+        _report_cache.clear()
+        _report_cache_stats.update(hits=0, misses=0)
+
+
+def _report_cache_key(request: RunReportRequest, creds_path: Optional[str], dtype_backend: str,
+                      all_rows: bool) -> str:
+    """
+    Hash the serialized request, identical requests share the same key
+
+    :param request: RunReportRequest
+    :param creds_path: credentials the report is requested with, reports are never shared between credentials
+    :param dtype_backend: the DataFrame backend, the same request is cached once per backend
+    :param all_rows: True when every row of the report is returned, the limit of the request is then ignored
+    :return: sha1 hex digest
+    """
+    creds = os.path.abspath(creds_path) if creds_path else None
+    return sha1(RunReportRequest.serialize(request) + repr((creds, dtype_backend, all_rows)).encode()).hexdigest()
+
+
+def _prune_report_cache(now: float) -> None:
+    """
+    Drop the reports that have expired, must be called while holding _report_cache_lock
+
+    :param now: time.monotonic() of the caller
+    """
+    for expired in [k for k, (ts, _) in _report_cache.items() if now - ts >= REPORT_CACHE_TTL]:
+        del _report_cache[expired]
+
+
+def _report_cache_get(key: str) -> Optional[pd.DataFrame]:
+    """
+    Get a cached report if it is younger than REPORT_CACHE_TTL
+
+    :param key: key from _report_cache_key
+    :return: pandas.DataFrame or None
+    """
+    with _report_cache_lock:
+        _prune_report_cache(monotonic())
+        entry = _report_cache.get(key)
+        if entry is not None:
+            _report_cache_stats['hits'] += 1
+            return entry[1]
+        _report_cache_stats['misses'] += 1
+        return None
+
+
+def _report_cache_put(key: str, df: pd.DataFrame) -> None:
+    """
+    Cache a report, drop the reports that have expired and the oldest reports past REPORT_CACHE_MAX_ENTRIES
+
+    :param key: key from _report_cache_key
+    :param df: pandas.DataFrame
+    """
+    if REPORT_CACHE_MAX_ENTRIES < 1:
+        return
+
+    now = monotonic()
+    with _report_cache_lock:
+        _prune_report_cache(now)
+        # re-inserting moves the key to the end, the dict stays ordered from oldest to newest
+        _report_cache.pop(key, None)
+        _report_cache[key] = (now, df)
+        while len(_report_cache) > REPORT_CACHE_MAX_ENTRIES:
+            del _report_cache[next(iter(_report_cache))]
+
+
+@lru_cache(maxsize=None)
+def _get_client(creds_path: Optional[str] = None) -> BetaAnalyticsDataClient:
+    """
+    Create one BetaAnalyticsDataClient per creds_path so every report in the process shares the same channel
+
+    :param creds_path: if specified use credentials.json path and not the environment variable
+    :return: BetaAnalyticsDataClient
+    """
+    if creds_path:
+        return BetaAnalyticsDataClient.from_service_account_json(creds_path)
+    return BetaAnalyticsDataClient()
+
+
+@lru_cache(maxsize=None)
+def _get_client_pool(creds_path: Optional[str] = None, pool_size: int = 1) -> Tuple[BetaAnalyticsDataClient, ...]:
+    """
+    Create pool_size BetaAnalyticsDataClients that each own a separate channel. A single HTTP/2 connection only
+    allows about 100 concurrent streams, after which GA4 queues the requests, so spreading concurrent requests
+    over several connections avoids the queueing. grpc.use_local_subchannel_pool stops gRPC from sharing one
+    connection between channels created with the same arguments
+
+    :param creds_path: if specified use credentials.json path and not the environment variable
+    :param pool_size: number of clients in the pool
+    :return: tuple of BetaAnalyticsDataClient
+    """
+    if pool_size < 1:
+        raise ValueError(f"channel_pool_size must be at least 1 you entered '{pool_size}'")
+    if pool_size == 1:
+        return (_get_client(creds_path),)
+
+    clients = []
+    for _ in range(pool_size):
+        channel = BetaAnalyticsDataGrpcTransport.create_channel(credentials_file=creds_path,
+                                                                options=[('grpc.use_local_subchannel_pool', 1)])
+        clients.append(BetaAnalyticsDataClient(transport=BetaAnalyticsDataGrpcTransport(channel=channel)))
+    return tuple(clients)
+
+
+async def _get_async_client(creds_path: Optional[str] = None) -> BetaAnalyticsDataAsyncClient:
+    """
+    Get the BetaAnalyticsDataAsyncClient shared by every report of creds_path in the running event loop. Async
+    channels are bound to the loop they were created in, so there is one client per (creds_path, loop). Clients
+    of event loops that have been closed are closed and dropped when a new client is created
+
+    :param creds_path: if specified use credentials.json path and not the environment variable
+    :return: BetaAnalyticsDataAsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get((creds_path, loop))
+        if client is not None:
+            return client
+
+        if creds_path:
+            client = BetaAnalyticsDataAsyncClient.from_service_account_json(creds_path)
+        else:
+            client = BetaAnalyticsDataAsyncClient()
+        _async_clients[(creds_path, loop)] = client
+        stale = [_async_clients.pop(key) for key in list(_async_clients) if key[1].is_closed()]
+
+    for stale_client in stale:
+        await stale_client.transport.close()
+    return client
+
+
+@lru_cache(maxsize=None)
+def _compile_row_parser(n_dimensions: int, n_metrics: int) -> Callable:
+    """
+    Generate a row parser specialized for the number of dimensions and metrics. The loop over the values of a
+    row is unrolled into one line per column, so the hot loop only walks the rows
+
+    The generated function is parse(rows, dimension_cols, metric_cols), it writes the value string of row r into
+    index r of every pre-sized column
+
+    :param n_dimensions: number of dimensions in the report
+    :param n_metrics: number of metrics in the report
+    :return: the parser function
+    """
+    lines = ['def parse(rows, dimension_cols, metric_cols):']
+    if n_dimensions:
+        lines.append(f"    {', '.join(f'd{j}' for j in range(n_dimensions))}, = dimension_cols")
+    if n_metrics:
+        lines.append(f"    {', '.join(f'm{j}' for j in range(n_metrics))}, = metric_cols")
+    lines.append('    for r, row in enumerate(rows):')
+    if n_dimensions:
+        lines.append('        dv = row.dimension_values')
+        lines.extend(f'        d{j}[r] = dv[{j}].value' for j in range(n_dimensions))
+    if n_metrics:
+        lines.append('        mv = row.metric_values')
+        lines.extend(f'        m{j}[r] = mv[{j}].value' for j in range(n_metrics))
+    if not n_dimensions and not n_metrics:
+        lines.append('        pass')
+
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['parse']
+
+
+def _to_arrow_frame(dimension_headers: List[str], dimension_cols: List[List[str]],
+                    metric_headers: List[str], metric_cols: List[np.ndarray]) -> pd.DataFrame:
+    """
+    Build a DataFrame backed by pyarrow, each dimension column is a single Arrow string buffer instead of one
+    python str per cell
+
+    :param dimension_headers: dimension column names
+    :param dimension_cols: dimension values, one list per column
+    :param metric_headers: metric column names
+    :param metric_cols: parsed metric values, one array per column
+    :return: pandas.DataFrame with pandas.ArrowDtype columns
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError("dtype_backend='pyarrow' requires pyarrow, install it with `pip install pyarrow`") from e
+
+    table = pa.table({**{name: pa.array(col, type=pa.string()) for name, col in zip(dimension_headers, dimension_cols)},
+                      **{name: pa.array(col) for name, col in zip(metric_headers, metric_cols)}})
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
 
 # noinspection PyTypeChecker
 class BuildReport:
+    # build the FilterExpression for each filter_type
+    _FILTER_BUILDERS = {
+        'string_filter': lambda field_name, filter_values, filter_case, match_type, **_: FilterExpression(
+            filter=Filter(field_name=field_name,
+                          string_filter=Filter.StringFilter(match_type=match_type,
+                                                            value=filter_values,
+                                                            case_sensitive=filter_case))
+        ),
+        'in_list_filter': lambda field_name, filter_values, filter_case, **_: FilterExpression(
+            filter=Filter(field_name=field_name,
+                          in_list_filter=Filter.InListFilter(values=filter_values,
+                                                             case_sensitive=filter_case))
+        ),
+        'numeric_filter': lambda field_name, filter_values, operation, **_: FilterExpression(
+            filter=Filter(field_name=field_name,
+                          numeric_filter=Filter.NumericFilter(operation=operation,
+                                                              value=filter_values))
+        ),
+        'between_filter': lambda field_name, from_value, to_value, **_: FilterExpression(
+            filter=Filter(field_name=field_name,
+                          between_filter=Filter.BetweenFilter(from_value=from_value,
+                                                              to_value=to_value))
+        ),
+    }
+
     def __init__(self, property_id: str, ga_dimensions: List[str], ga_metrics: List[str],
-                 start_date: str, end_date: str, creds_path: Optional[str] = None) -> None:
+                 start_date: str, end_date: str, creds_path: Optional[str] = None,
+                 channel_pool_size: int = 1, dtype_backend: Literal['numpy', 'pyarrow'] = 'numpy',
+                 page_size: int = 100000, keep_empty_rows: bool = False) -> None:
         """
         This builds a GA4 report that can be run with or without a filter
 
@@ -46,18 +305,31 @@ class BuildReport:
         :param start_date: pull data starting from this date
         :param end_date: pull data ending on this date
         :param creds_path: if specified use credentials.json path and not the environment variable
+        :param channel_pool_size: number of gRPC channels requests are spread over, only useful when a lot of
+                                  pages or reports are requested at the same time
+        :param dtype_backend: 'numpy' or 'pyarrow', 'pyarrow' returns pandas.ArrowDtype columns and requires pyarrow
+        :param page_size: number of rows requested per page when running the report, at most PAGE_SIZE
+        :param keep_empty_rows: if True GA4 also returns rows where every metric is 0
         """
+        if dtype_backend not in ('numpy', 'pyarrow'):
+            raise ValueError(f"dtype_backend must be 'numpy' or 'pyarrow' you entered '{dtype_backend}'")
+        if not 1 <= page_size <= PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {PAGE_SIZE} you entered '{page_size}'")
+
         self.dimension_filter = None
         self.metric_filter = None
         self.dimensions = [Dimension(name=x) for x in ga_dimensions]
         self.metrics = [Metric(name=x) for x in ga_metrics]
         self.date_ranges = [DateRange(start_date=start_date, end_date=end_date)]
         self.property_id = property_id
+        self.dtype_backend = dtype_backend
+        self.creds_path = creds_path
+        self.page_size = page_size
+        self.keep_empty_rows = keep_empty_rows
 
-        if creds_path:
-            self.client = BetaAnalyticsDataClient.from_service_account_json(creds_path)
-        else:
-            self.client = BetaAnalyticsDataClient()
+        self.clients = _get_client_pool(creds_path, channel_pool_size)
+        self.client = self.clients[0]
+        self._client_cycle = cycle(self.clients)
 
     def add_filter(self,
                    filter_type: Literal['string_filter', 'in_list_filter', 'numeric_filter', 'between_filter'],
@@ -119,85 +391,278 @@ class BuildReport:
         :param to_value: only used with BetweenFilter
         """
 
-        literals = ['string_filter', 'in_list_filter', 'numeric_filter', 'between_filter']
-        if filter_type not in literals:
+        expression = self._build_filter(filter_type=filter_type,
+                                        field_name=field_name,
+                                        filter_values=filter_values,
+                                        filter_case=filter_case,
+                                        match_type=match_type,
+                                        operation=operation,
+                                        from_value=from_value,
+                                        to_value=to_value)
+        if filter_dimension:
+            self.dimension_filter = expression
+        else:
+            self.metric_filter = expression
+
+    @classmethod
+    def _build_filter(cls,
+                      filter_type: Literal['string_filter', 'in_list_filter', 'numeric_filter', 'between_filter'],
+                      field_name: str,
+                      filter_values: Optional[List[str] | str | NumericValue] = None,
+                      filter_case: Optional[bool] = False,
+                      match_type: Optional[Filter.StringFilter.MatchType] = Filter.StringFilter.MatchType(0),
+                      operation: Optional[Filter.NumericFilter.Operation] = Filter.NumericFilter.Operation(0),
+                      from_value: Optional[NumericValue] = None,
+                      to_value: Optional[NumericValue] = None) -> FilterExpression:
+        """
+        Build the FilterExpression used by add_filter and run_reports, see add_filter for the params
+
+        :return: FilterExpression
+        """
+        if filter_type not in cls._FILTER_BUILDERS:
             raise ValueError(f"filter_type must be 'string_filter', 'in_list_filter', 'numeric_filter' "
                              f"or 'between_filter' you entered '{filter_type}'")
 
-        if filter_type == 'string_filter' and filter_type:
-            self.dimension_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                   string_filter=Filter.StringFilter(
-                                                                       match_type=match_type,
-                                                                       value=filter_values,
-                                                                       case_sensitive=filter_case
-                                                                   )
-                                                                   )
-                                                     )
-        elif filter_type == 'string_filter' and filter_type is False:
-            self.metric_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                string_filter=Filter.StringFilter(
-                                                                    match_type=match_type,
-                                                                    value=filter_values,
-                                                                    case_sensitive=filter_case
-                                                                )
-                                                                )
-                                                  )
-
-        elif filter_type == 'in_list_filter' and filter_dimension:
-            self.dimension_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                   in_list_filter=Filter.InListFilter(
-                                                                       values=filter_values,
-                                                                       case_sensitive=filter_case
-                                                                   )
-                                                                   )
-                                                     )
-        elif filter_type == 'in_list_filter' and filter_dimension is False:
-            self.metric_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                in_list_filter=Filter.InListFilter(
-                                                                    values=filter_values,
-                                                                    case_sensitive=filter_case
-                                                                )
-                                                                )
-                                                  )
-
-        elif filter_type == 'numeric_filter' and filter_dimension:
-            self.dimension_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                   numeric_filter=Filter.NumericFilter(
-                                                                       operation=operation,
-                                                                       value=filter_values
-                                                                   )
-                                                                   )
-                                                     )
-        elif filter_type == 'numeric_filter' and filter_dimension is False:
-            self.metric_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                numeric_filter=Filter.NumericFilter(
-                                                                    operation=operation,
-                                                                    value=filter_values
-                                                                )
-                                                                )
-                                                  )
-
-        elif filter_type == 'between_filter' and filter_dimension:
-            self.dimension_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                   between_filter=Filter.BetweenFilter(
-                                                                       from_value=from_value,
-                                                                       to_value=to_value
-                                                                   )
-                                                                   )
-                                                     )
-        elif filter_type == 'between_filter' and filter_dimension is False:
-            self.metric_filter = FilterExpression(filter=Filter(field_name=field_name,
-                                                                between_filter=Filter.BetweenFilter(
-                                                                    from_value=from_value,
-                                                                    to_value=to_value
-                                                                )
-                                                                )
-                                                  )
-
-    def run_report(self, offset: int = 0, limit: int = 10000) -> pd.DataFrame:
+        return cls._FILTER_BUILDERS[filter_type](field_name=field_name,
+                                                 filter_values=filter_values,
+                                                 filter_case=filter_case,
+                                                 match_type=match_type,
+                                                 operation=operation,
+                                                 from_value=from_value,
+                                                 to_value=to_value)
+
+    def _next_client(self) -> BetaAnalyticsDataClient:
+        """
+        Pick the next client from the channel pool in round-robin order
+
+        :return: BetaAnalyticsDataClient
+        """
+        return next(self._client_cycle)
+
+    def _build_request(self, offset: int, limit: int, dimension_filter: Optional[FilterExpression] = None,
+                       metric_filter: Optional[FilterExpression] = None) -> RunReportRequest:
+        """
+        Build the RunReportRequest for one page of the report
+
+        :param offset: row to start the page from
+        :param limit: number of rows in the page
+        :param dimension_filter: optional FilterExpression applied to dimensions
+        :param metric_filter: optional FilterExpression applied to metrics
+        :return: RunReportRequest
+        """
+        if dimension_filter:
+            return RunReportRequest(property=f'properties/{self.property_id}',
+                                    dimensions=self.dimensions,
+                                    metrics=self.metrics,
+                                    date_ranges=self.date_ranges,
+                                    dimension_filter=dimension_filter,
+                                    offset=offset,
+                                    limit=limit,
+                                    keep_empty_rows=self.keep_empty_rows)
+        elif metric_filter:
+            return RunReportRequest(property=f'properties/{self.property_id}',
+                                    dimensions=self.dimensions,
+                                    metrics=self.metrics,
+                                    date_ranges=self.date_ranges,
+                                    metric_filter=metric_filter,
+                                    offset=offset,
+                                    limit=limit,
+                                    keep_empty_rows=self.keep_empty_rows)
+        else:
+            return RunReportRequest(property=f'properties/{self.property_id}',
+                                    dimensions=self.dimensions,
+                                    metrics=self.metrics,
+                                    date_ranges=self.date_ranges,
+                                    offset=offset,
+                                    limit=limit,
+                                    keep_empty_rows=self.keep_empty_rows)
+
+    def _first_request(self, offset: int, limit: Optional[int], dimension_filter: Optional[FilterExpression] = None,
+                       metric_filter: Optional[FilterExpression] = None) -> RunReportRequest:
+        """
+        Build the request for the first page of the report
+
+        :param offset: row to start from
+        :param limit: max number of rows to fetch, None fetches every row
+        :param dimension_filter: optional FilterExpression applied to dimensions
+        :param metric_filter: optional FilterExpression applied to metrics
+        :return: RunReportRequest
+        """
+        first_limit = self.page_size if limit is None else min(limit, self.page_size)
+        return self._build_request(offset, first_limit, dimension_filter, metric_filter)
+
+    def _next_requests(self, first_request: RunReportRequest, row_count: int,
+                       limit: Optional[int]) -> List[RunReportRequest]:
+        """
+        Build the requests for the pages after the first one, once the first page told us the row_count
+
+        :param first_request: RunReportRequest of the first page
+        :param row_count: total number of rows in the report
+        :param limit: max number of rows to fetch, None fetches every row
+        :return: list of RunReportRequest, empty if the first page holds every row
+        """
+        offset = first_request.offset
+        end = row_count if limit is None else min(row_count, offset + limit)
+        return self._page_requests(first_request, offset + first_request.limit, end, self.page_size)
+
+    def _fetch_frames(self, offset: int, limit: Optional[int], max_workers: int) -> List[pd.DataFrame]:
+        """
+        Fetch every page of the report. The first page tells us the total row_count, the remaining pages
+        are then requested concurrently. Each page is converted to a DataFrame as soon as it arrives, so the
+        response can be freed before the next pages are concatenated
+
+        :param offset: row to start from
+        :param limit: max number of rows to fetch, None fetches every row
+        :param max_workers: max number of pages requested at the same time
+        :return: list of pandas.DataFrame in row order
+        """
+        base = self._first_request(offset, limit, self.dimension_filter, self.metric_filter)
+        first = self._next_client().run_report(base, timeout=REQUEST_TIMEOUT)
+        requests = self._next_requests(base, first.row_count, limit)
+        frames = [self._to_frame(first)]
+        del first
+        if not requests:
+            return frames
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames.extend(executor.map(self._fetch_frame, requests))
+        return frames
+
+    @staticmethod
+    def _page_requests(base: RunReportRequest, start: int, end: int, page_size: int) -> List[RunReportRequest]:
+        """
+        Build the requests for the pages between start and end. The first page request is copied and only
+        offset and limit are changed instead of building every page from scratch
+
+        :param base: RunReportRequest of the first page
+        :param start: row the second page starts from
+        :param end: row after the last row of the report
+        :param page_size: number of rows per page
+        :return: list of RunReportRequest
+        """
+        requests = []
+        for page_offset in range(start, end, page_size):
+            request = RunReportRequest()
+            RunReportRequest.copy_from(request, base)
+            request.offset = page_offset
+            request.limit = min(page_size, end - page_offset)
+            requests.append(request)
+        return requests
+
+    @staticmethod
+    def _check_limit(limit: Optional[int]) -> None:
+        """
+        Raise a ValueError if limit is not None or a positive number of rows
+
+        :param limit: max number of rows to return, None returns every row
+        """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be None or at least 1 you entered '{limit}'")
+
+    @staticmethod
+    def _check_max_workers(max_workers: int) -> None:
+        """
+        Raise a ValueError if max_workers is not a positive number of pages
+
+        :param max_workers: max number of pages requested at the same time
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 you entered '{max_workers}'")
+
+    def _cache_key(self, offset: int, limit: Optional[int]) -> str:
+        """
+        Report cache key of run_report and run_report_async
+
+        :param offset: row to start from
+        :param limit: max number of rows to return, None returns every row
+        :return: key from _report_cache_key
+        """
+        request = self._build_request(offset, 0 if limit is None else limit, self.dimension_filter,
+                                      self.metric_filter)
+        return _report_cache_key(request, self.creds_path, self.dtype_backend, all_rows=limit is None)
+
+    def _cache_lookup(self, offset: int, limit: Optional[int],
+                      cache_bypass: bool) -> Tuple[str, Optional[pd.DataFrame]]:
+        """
+        Check limit and look the report up in the report cache, shared by run_report and run_report_async
+
+        :param offset: row to start from
+        :param limit: max number of rows to return, None returns every row
+        :param cache_bypass: if True never return a cached report
+        :return: cache key and a copy of the cached report, or None if it is not cached
+        """
+        self._check_limit(limit)
+        key = self._cache_key(offset, limit)
+        df = None if cache_bypass else _report_cache_get(key)
+        return key, None if df is None else df.copy()
+
+    @staticmethod
+    def _finish_report(key: str, frames: List[pd.DataFrame], cache_bypass: bool) -> pd.DataFrame:
+        """
+        Concatenate the page frames and cache the report, shared by run_report and run_report_async
+
+        :param key: key from _cache_key
+        :param frames: list of pandas.DataFrame in row order
+        :param cache_bypass: if True do not cache the report
+        :return: pandas.DataFrame
+        """
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        frames.clear()
+        if cache_bypass:
+            return df
+        _report_cache_put(key, df)
+        return df.copy()
+
+    def _fetch_frame(self, request: RunReportRequest) -> pd.DataFrame:
+        """
+        Request a single page of the report and convert it to a DataFrame
+
+        :param request: RunReportRequest
+        :return: pandas.DataFrame
+        """
+        return self._to_frame(self._next_client().run_report(request, timeout=REQUEST_TIMEOUT))
+
+    def _to_frame(self, page: RunReportResponse) -> pd.DataFrame:
+        """
+        Convert a RunReportResponse page into a DataFrame
+
+        :param page: RunReportResponse
+        :return: pandas.DataFrame
+        """
+        # get column names for the metrics and dimensions
+        dimension_headers = [header.name for header in page.dimension_headers]
+        page_metric_headers = page.metric_headers
+        metric_headers = [header.name for header in page_metric_headers]
+        # integer metrics become int64 columns, every other metric float64
+        metric_dtypes = [METRIC_DTYPES.get(header.type_, np.float64) for header in page_metric_headers]
+        # walk the raw protobuf rows once, the proto-plus wrapper builds a new python object on every access
+        rows = RunReportResponse.pb(page).rows
+        nrows = len(rows)
+        # collect the value strings in a single pass into pre-sized columns
+        dimension_cols = [[None] * nrows for _ in range(len(dimension_headers))]
+        metric_cols = [[None] * nrows for _ in range(len(metric_headers))]
+        # the parser follows the response headers, GA4 adds a dateRange dimension when there are several date ranges
+        _compile_row_parser(len(dimension_headers), len(metric_headers))(rows, dimension_cols, metric_cols)
+        # numpy parses a whole column of strings in C, which is faster than calling int or float on every cell
+        metric_cols = [np.array(col, dtype=dtype) for col, dtype in zip(metric_cols, metric_dtypes)]
+        # create your frame
+        if self.dtype_backend == 'pyarrow':
+            return _to_arrow_frame(dimension_headers, dimension_cols, metric_headers, metric_cols)
+        # the metric arrays were allocated for this frame, so pandas can keep them instead of copying them into
+        # consolidated blocks
+        return pd.DataFrame({**dict(zip(dimension_headers, dimension_cols)),
+                             **dict(zip(metric_headers, metric_cols))}, copy=False)
+
+    def run_report(self, offset: int = 0, limit: Optional[int] = None, max_workers: int = 8,
+                   cache_bypass: bool = False) -> pd.DataFrame:
         """
         This is used to actually RunReportRequest, which can be used with add_filter or not
 
+        GA4 caps the number of rows returned per request, so the report is fetched in pages of page_size rows
+        and the pages after the first one are requested concurrently. Results are cached for REPORT_CACHE_TTL
+        seconds, so running the same report again returns a copy of the cached DataFrame. At most
+        REPORT_CACHE_MAX_ENTRIES reports are cached
+
         SAMPLE CODE
 
         from GoogleAnalytics4 import GA4
@@ -218,47 +683,134 @@ class BuildReport:
 
         df = report.run_report()
 
-        :param offset: int
-        :param limit: int
+        :param offset: row to start from
+        :param limit: max number of rows to return, if None return every row
+        :param max_workers: max number of pages requested at the same time
+        :param cache_bypass: if True always request the report from GA4 and do not cache the result
         :return: pandas.DataFrame
         """
-        if self.dimension_filter:
-            request = RunReportRequest(property=f'properties/{self.property_id}',
-                                       dimensions=self.dimensions,
-                                       metrics=self.metrics,
-                                       date_ranges=self.date_ranges,
-                                       dimension_filter=self.dimension_filter,
-                                       offset=offset,
-                                       limit=limit)
-        elif self.metric_filter:
-            request = RunReportRequest(property=f'properties/{self.property_id}',
-                                       dimensions=self.dimensions,
-                                       metrics=self.metrics,
-                                       date_ranges=self.date_ranges,
-                                       metric_filter=self.metric_filter,
-                                       offset=offset,
-                                       limit=limit)
-        else:
-            request = RunReportRequest(property=f'properties/{self.property_id}',
-                                       dimensions=self.dimensions,
-                                       metrics=self.metrics,
-                                       date_ranges=self.date_ranges,
-                                       offset=offset,
-                                       limit=limit)
-
-        # added an extra minute to the timeout
-        data = self.client.run_report(request, timeout=3600 * 2)
-        # get column names for the metrics and dimensions
-        dimension_headers = [header.name for header in data.dimension_headers]
-        metric_headers = [header.name for header in data.metric_headers]
-        # get row values
-        dimension_vals = [val.value for row in data.rows for val in row.dimension_values]
-        metric_vals = [val.value for row in data.rows for val in row.metric_values]
-        # create your frame
-        df = pd.DataFrame(np.transpose([dimension_vals[i::len(self.dimensions)] for i in range(len(self.dimensions))]),
-                          columns=dimension_headers)
-        # assign metric values
-        df.loc[:, metric_headers] = np.transpose([metric_vals[i::len(self.metrics)] for i in range(len(self.metrics))])
-        # convert metrics to numeric
-        df[df.columns[len(self.dimensions):]] = df[df.columns[len(self.dimensions):]].apply(lambda x: pd.to_numeric(x))
-        return df
+        self._check_max_workers(max_workers)
+        key, df = self._cache_lookup(offset, limit, cache_bypass)
+        if df is not None:
+            return df
+        return self._finish_report(key, self._fetch_frames(offset, limit, max_workers), cache_bypass)
+
+    async def run_report_async(self, offset: int = 0, limit: Optional[int] = None, max_workers: int = 8,
+                               cache_bypass: bool = False) -> pd.DataFrame:
+        """
+        Async version of run_report, the pages after the first one are awaited together on one channel. Use it
+        with asyncio.gather to run a lot of reports at the same time. Results share the run_report cache
+
+        SAMPLE CODE
+
+        import asyncio
+        from GoogleAnalytics4 import GA4
+
+        reports = []
+        for page_path in ['/Page/1', '/Page/2']:
+            report = GA4.BuildReport(property_id='123456789',
+                                     ga_dimensions=['pagePath', 'pageTitle'],
+                                     ga_metrics=['screenPageViews', 'activeUsers', 'averageSessionDuration'],
+                                     start_date='2023-02-01',
+                                     end_date='today')
+            report.add_filter(filter_type='string_filter',
+                              filter_dimension=True,
+                              field_name='pagePath',
+                              filter_values=page_path)
+            reports.append(report)
+
+
+        async def main():
+            return await asyncio.gather(*[report.run_report_async() for report in reports])
+
+        dfs = asyncio.run(main())
+
+        :param offset: row to start from
+        :param limit: max number of rows to return, if None return every row
+        :param max_workers: max number of pages requested at the same time
+        :param cache_bypass: if True always request the report from GA4 and do not cache the result
+        :return: pandas.DataFrame
+        """
+        self._check_max_workers(max_workers)
+        key, df = self._cache_lookup(offset, limit, cache_bypass)
+        if df is not None:
+            return df
+
+        client = await _get_async_client(self.creds_path)
+        base = self._first_request(offset, limit, self.dimension_filter, self.metric_filter)
+        first = await client.run_report(base, timeout=REQUEST_TIMEOUT)
+        requests = self._next_requests(base, first.row_count, limit)
+        frames = [self._to_frame(first)]
+        del first
+
+        # at most max_workers pages are in flight, so a large report does not queue hundreds of streams
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch_frame(request: RunReportRequest) -> pd.DataFrame:
+            async with semaphore:
+                page = await client.run_report(request, timeout=REQUEST_TIMEOUT)
+            return self._to_frame(page)
+
+        frames.extend(await asyncio.gather(*[fetch_frame(request) for request in requests]))
+        return self._finish_report(key, frames, cache_bypass)
+
+    def run_reports(self, filters: List[dict], offset: int = 0, limit: Optional[int] = None,
+                    max_workers: int = 8) -> List[pd.DataFrame]:
+        """
+        Run one report per filter using batch_run_reports, which sends the first page of up to BATCH_SIZE reports
+        in a single request. Reports with more rows than page_size get their remaining pages requested
+        concurrently, like run_report. Each filter is a dict of the add_filter params. Filters added with
+        add_filter are not used and the reports are not cached
+
+        SAMPLE CODE
+
+        from GoogleAnalytics4 import GA4
+
+        report = GA4.BuildReport(property_id='123456789',
+                         ga_dimensions=['pagePath', 'pageTitle'],
+                         ga_metrics=['screenPageViews', 'activeUsers', 'averageSessionDuration'],
+                         start_date='2023-02-01',
+                         end_date='today')
+
+        dfs = report.run_reports(filters=[{'filter_type': 'string_filter',
+                                           'filter_dimension': True,
+                                           'field_name': 'pagePath',
+                                           'filter_values': page_path} for page_path in ['/Page/1', '/Page/2']])
+
+        :param filters: list of dicts with the add_filter params
+        :param offset: row to start each report from
+        :param limit: max number of rows returned for each report, if None return every row
+        :param max_workers: max number of remaining pages requested at the same time
+        :return: list of pandas.DataFrame in the same order as filters
+        """
+        self._check_limit(limit)
+        self._check_max_workers(max_workers)
+        requests = []
+        for params in filters:
+            params = dict(params)
+            filter_dimension = params.pop('filter_dimension')
+            expression = self._build_filter(**params)
+            if filter_dimension:
+                requests.append(self._first_request(offset, limit, dimension_filter=expression))
+            else:
+                requests.append(self._first_request(offset, limit, metric_filter=expression))
+
+        report_frames = []
+        next_requests = []
+        for i in range(0, len(requests), BATCH_SIZE):
+            batch = BatchRunReportsRequest(property=f'properties/{self.property_id}',
+                                           requests=requests[i:i + BATCH_SIZE])
+            data = self._next_client().batch_run_reports(batch, timeout=REQUEST_TIMEOUT)
+            for request, page in zip(requests[i:i + BATCH_SIZE], data.reports):
+                next_requests.extend((len(report_frames), next_request)
+                                     for next_request in self._next_requests(request, page.row_count, limit))
+                report_frames.append([self._to_frame(page)])
+            del data
+
+        if next_requests:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                frames = executor.map(self._fetch_frame, [request for _, request in next_requests])
+                for (report, _), frame in zip(next_requests, frames):
+                    report_frames[report].append(frame)
+
+        return [frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True) for frames in report_frames]
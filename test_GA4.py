@@ -0,0 +1,277 @@
+import asyncio
+
+import numpy as np
+import pytest
+from google.analytics.data_v1beta.types import (BatchRunReportsResponse, DimensionHeader, DimensionValue, Filter,
+                                                FilterExpression, MetricHeader, MetricType, MetricValue, NumericValue,
+                                                Row, RunReportResponse)
+
+import GA4
+
+TOTAL_ROWS = 23
+
+
+def make_response(request, total=TOTAL_ROWS, extra_dimensions=()):
+    """
+    Build the RunReportResponse GA4 would return for request, over a report of total rows. Row i has the
+    dimension values '<name>-i', integer metrics i and every other metric i + 0.5. Metrics ending in Duration
+    are TYPE_SECONDS, every other metric is TYPE_INTEGER
+    """
+    dimensions = [dimension.name for dimension in request.dimensions] + list(extra_dimensions)
+    metric_headers = [MetricHeader(name=metric.name,
+                                   type_=MetricType.TYPE_SECONDS if metric.name.endswith('Duration')
+                                   else MetricType.TYPE_INTEGER)
+                      for metric in request.metrics]
+    end = min(request.offset + (request.limit or 10000), total)
+    rows = [Row(dimension_values=[DimensionValue(value=f'{name}-{i}') for name in dimensions],
+                metric_values=[MetricValue(value=f'{i}.5' if header.type_ == MetricType.TYPE_SECONDS else str(i))
+                               for header in metric_headers])
+            for i in range(request.offset, end)]
+    return RunReportResponse(dimension_headers=[DimensionHeader(name=name) for name in dimensions],
+                             metric_headers=metric_headers,
+                             rows=rows,
+                             row_count=total)
+
+
+class StubClient:
+    def __init__(self):
+        self.requests = []
+
+    def run_report(self, request, timeout=None):
+        self.requests.append(request)
+        return make_response(request)
+
+    def batch_run_reports(self, request, timeout=None):
+        self.requests.append(request)
+        return BatchRunReportsResponse(reports=[make_response(report) for report in request.requests])
+
+
+class StubAsyncClient(StubClient):
+    async def run_report(self, request, timeout=None):
+        await asyncio.sleep(0)
+        return super().run_report(request, timeout)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    stub = StubClient()
+    monkeypatch.setattr(GA4, '_get_client', lambda creds_path=None: stub)
+    GA4._get_client_pool.cache_clear()
+    GA4.clear_report_cache()
+    yield stub
+    GA4._get_client_pool.cache_clear()
+    GA4.clear_report_cache()
+
+
+def build_report(dimensions=('pagePath', 'pageTitle'), metrics=('screenPageViews', 'averageSessionDuration'),
+                 **kwargs):
+    return GA4.BuildReport(property_id='123456789',
+                           ga_dimensions=list(dimensions),
+                           ga_metrics=list(metrics),
+                           start_date='2023-02-01',
+                           end_date='today',
+                           **kwargs)
+
+
+FILTER_PARAMS = {
+    'string_filter': {'filter_values': '/Page/1',
+                      'match_type': Filter.StringFilter.MatchType.EXACT,
+                      'filter_case': True},
+    'in_list_filter': {'filter_values': ['/', '/Page/1']},
+    'numeric_filter': {'filter_values': NumericValue(int64_value=5),
+                       'operation': Filter.NumericFilter.Operation.GREATER_THAN_OR_EQUAL},
+    'between_filter': {'from_value': NumericValue(int64_value=100),
+                       'to_value': NumericValue(int64_value=200)},
+}
+
+
+@pytest.mark.parametrize('filter_dimension', [True, False])
+@pytest.mark.parametrize('filter_type', list(FILTER_PARAMS))
+def test_add_filter(client, filter_type, filter_dimension):
+    report = build_report()
+    report.add_filter(filter_type=filter_type,
+                      filter_dimension=filter_dimension,
+                      field_name='field',
+                      **FILTER_PARAMS[filter_type])
+
+    expression = report.dimension_filter if filter_dimension else report.metric_filter
+    other = report.metric_filter if filter_dimension else report.dimension_filter
+    assert other is None
+    assert isinstance(expression, FilterExpression)
+    assert expression.filter.field_name == 'field'
+    assert FilterExpression.pb(expression).filter.WhichOneof('one_filter') == filter_type
+
+
+def test_add_filter_values(client):
+    report = build_report()
+    report.add_filter(filter_type='string_filter', filter_dimension=True, field_name='pagePath',
+                      **FILTER_PARAMS['string_filter'])
+    string_filter = report.dimension_filter.filter.string_filter
+
+    assert (string_filter.value, string_filter.match_type, string_filter.case_sensitive) == \
+        ('/Page/1', Filter.StringFilter.MatchType.EXACT, True)
+
+    report.add_filter(filter_type='between_filter', filter_dimension=False, field_name='screenPageViews',
+                      **FILTER_PARAMS['between_filter'])
+    between_filter = report.metric_filter.filter.between_filter
+
+    assert (between_filter.from_value.int64_value, between_filter.to_value.int64_value) == (100, 200)
+
+
+def test_add_filter_rejects_unknown_filter_type(client):
+    report = build_report()
+    with pytest.raises(ValueError):
+        report.add_filter(filter_type='regex_filter', filter_dimension=True, field_name='pagePath')
+    assert report.dimension_filter is None and report.metric_filter is None
+
+
+@pytest.mark.parametrize('dimensions, metrics', [
+    ((), ('screenPageViews',)),
+    (('pagePath',), ()),
+    (('pagePath',), ('screenPageViews',)),
+    (('pagePath', 'pageTitle', 'country'), ('screenPageViews', 'averageSessionDuration')),
+])
+def test_to_frame_shapes(client, dimensions, metrics):
+    report = build_report(dimensions, metrics)
+    df = report._to_frame(make_response(report._build_request(0, 5)))
+
+    assert list(df.columns) == [*dimensions, *metrics]
+    assert len(df) == 5
+    for name in dimensions:
+        assert df[name].tolist() == [f'{name}-{i}' for i in range(5)]
+    if 'screenPageViews' in metrics:
+        assert df['screenPageViews'].dtype == np.int64
+        assert df['screenPageViews'].tolist() == list(range(5))
+    if 'averageSessionDuration' in metrics:
+        assert df['averageSessionDuration'].dtype == np.float64
+        assert df['averageSessionDuration'].tolist() == [i + 0.5 for i in range(5)]
+
+
+def test_to_frame_empty_page(client):
+    report = build_report()
+    df = report._to_frame(make_response(report._build_request(0, 5), total=0))
+
+    assert list(df.columns) == ['pagePath', 'pageTitle', 'screenPageViews', 'averageSessionDuration']
+    assert df.empty
+
+
+def test_to_frame_follows_response_headers(client):
+    # GA4 adds a dateRange dimension when a report has several date ranges
+    report = build_report()
+    df = report._to_frame(make_response(report._build_request(0, 3), extra_dimensions=['dateRange']))
+
+    assert list(df.columns) == ['pagePath', 'pageTitle', 'dateRange', 'screenPageViews', 'averageSessionDuration']
+    assert df['dateRange'].tolist() == ['dateRange-0', 'dateRange-1', 'dateRange-2']
+
+
+def test_to_frame_pyarrow(client):
+    pytest.importorskip('pyarrow')
+    report = build_report(dtype_backend='pyarrow')
+    df = report._to_frame(make_response(report._build_request(0, 4)))
+
+    assert str(df['pagePath'].dtype) == 'string[pyarrow]'
+    assert str(df['screenPageViews'].dtype) == 'int64[pyarrow]'
+    assert df['averageSessionDuration'].tolist() == [0.5, 1.5, 2.5, 3.5]
+
+
+def test_page_requests(client):
+    base = build_report()._build_request(3, 5)
+    requests = GA4.BuildReport._page_requests(base, 8, 20, 5)
+
+    assert [(request.offset, request.limit) for request in requests] == [(8, 5), (13, 5), (18, 2)]
+    assert all(request.dimensions == base.dimensions for request in requests)
+    assert (base.offset, base.limit) == (3, 5)
+    assert GA4.BuildReport._page_requests(base, 8, 8, 5) == []
+
+
+@pytest.mark.parametrize('offset, limit, expected', [
+    (0, None, range(0, 23)),
+    (0, 5, range(0, 5)),
+    (3, 9, range(3, 12)),
+    (20, None, range(20, 23)),
+    (22, 10, range(22, 23)),
+])
+def test_run_report_windows(client, offset, limit, expected):
+    df = build_report(page_size=5).run_report(offset=offset, limit=limit)
+
+    assert df['screenPageViews'].tolist() == list(expected)
+    assert df.index.tolist() == list(range(len(expected)))
+    assert all(request.limit <= 5 for request in client.requests)
+
+
+@pytest.mark.parametrize('limit', [0, -1])
+def test_run_report_rejects_limit(client, limit):
+    with pytest.raises(ValueError):
+        build_report().run_report(limit=limit)
+
+
+@pytest.mark.parametrize('max_workers', [0, -1])
+def test_rejects_max_workers(client, max_workers):
+    report = build_report(page_size=5)
+    with pytest.raises(ValueError):
+        report.run_report(max_workers=max_workers)
+    with pytest.raises(ValueError):
+        asyncio.run(report.run_report_async(max_workers=max_workers))
+    with pytest.raises(ValueError):
+        report.run_reports([], max_workers=max_workers)
+    assert client.requests == []
+
+
+def test_run_report_cache(client):
+    report = build_report(page_size=5)
+    assert len(report.run_report(limit=3)) == 3
+    # a limited report must not be served for the full report
+    assert len(report.run_report()) == TOTAL_ROWS
+    calls = len(client.requests)
+
+    df = report.run_report()
+    df['screenPageViews'] = 0
+    assert report.run_report()['screenPageViews'].tolist() == list(range(TOTAL_ROWS))
+    assert len(client.requests) == calls
+    assert GA4.report_cache_info() == {'hits': 2, 'misses': 2, 'size': 2}
+
+
+def test_run_report_cache_bypass_is_not_stored(client):
+    build_report().run_report(cache_bypass=True)
+
+    assert GA4.report_cache_info()['size'] == 0
+
+
+def test_report_cache_key_includes_credentials(client):
+    request = build_report()._build_request(0, 0)
+
+    assert (GA4._report_cache_key(request, None, 'numpy', True)
+            != GA4._report_cache_key(request, '/path/to/credentials.json', 'numpy', True))
+
+
+def test_keep_empty_rows(client):
+    report = build_report(page_size=5, keep_empty_rows=True)
+    report.run_report()
+
+    assert len(client.requests) == 5
+    assert all(request.keep_empty_rows for request in client.requests)
+    assert report._cache_key(0, None) != build_report(page_size=5)._cache_key(0, None)
+
+
+def test_run_reports_fetches_remaining_pages(client):
+    filters = [{'filter_type': 'string_filter',
+                'filter_dimension': True,
+                'field_name': 'pagePath',
+                'filter_values': f'/Page/{i}'} for i in range(6)]
+    dfs = build_report(page_size=5).run_reports(filters)
+
+    assert len(dfs) == 6
+    assert all(df['screenPageViews'].tolist() == list(range(TOTAL_ROWS)) for df in dfs)
+
+
+def test_run_report_async(client, monkeypatch):
+    stub = StubAsyncClient()
+
+    async def get_async_client(creds_path=None):
+        return stub
+
+    monkeypatch.setattr(GA4, '_get_async_client', get_async_client)
+    df = asyncio.run(build_report(page_size=5).run_report_async(offset=2, limit=10, max_workers=2))
+
+    assert df['screenPageViews'].tolist() == list(range(2, 12))
+    assert [(request.offset, request.limit) for request in stub.requests] == [(2, 5), (7, 5)]